@@ -4,104 +4,138 @@ Generate placeholder terrain textures with noise variation.
 These are temporary textures that can be replaced with AI-generated ones.
 
 Reads terrain definitions from terrain_config.json (single source of truth).
+
+Requires pillow and numpy. Run under CPython: the work is whole-array NumPy,
+which PyPy does not speed up. Pass --force to regenerate up-to-date textures.
 """
 
+import argparse
+import functools
 import json
+import multiprocessing
 import os
-from PIL import Image, ImageDraw, ImageFilter
-import random
-import math
+import numpy as np
+from PIL import Image
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "terrain_config.json")
 
+# Distinct noise fields shared across terrains (each reused in four rotations)
+NOISE_BANK_SIZE = 4
 
+
+@functools.lru_cache(maxsize=1)
 def load_terrain_config():
-    """Load terrain definitions from terrain_config.json."""
-    config_path = os.path.join(os.path.dirname(__file__), "terrain_config.json")
-    with open(config_path, 'r') as f:
+    """Load terrain definitions from terrain_config.json (parsed once per process)."""
+    with open(CONFIG_PATH, 'r') as f:
         return json.load(f)
 
 
-def generate_noise_texture(base_color, size=512, noise_strength=25, seed=None):
-    """Generate a texture with Perlin-like noise variation."""
-    if seed is not None:
-        random.seed(seed)
+def _value_noise(rng, size, cells):
+    """Smoothly interpolated lattice noise in [-1, 1] that tiles with period `size`."""
+    lattice = rng.random((cells, cells), dtype=np.float32) * 2.0 - 1.0
+
+    coords = np.arange(size, dtype=np.float32) * (cells / size)
+    i = coords.astype(np.intp)
+    f = coords - i
+    f = f * f * (3.0 - 2.0 * f)  # smoothstep fade hides the lattice
+
+    # The far lattice neighbour wraps, so the last column/row blends back into the first
+    rows, cols = i[:, None], i[None, :]
+    next_rows, next_cols = (rows + 1) % cells, (cols + 1) % cells
+    fy, fx = f[:, None], f[None, :]
+    top = lattice[rows, cols] * (1 - fx) + lattice[rows, next_cols] * fx
+    bottom = lattice[next_rows, cols] * (1 - fx) + lattice[next_rows, next_cols] * fx
+    return top * (1 - fy) + bottom * fy
+
 
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
+def _fbm_noise(rng, size, octaves=3, scale=64):
+    """Sum octaves of value noise (fBm), normalized back to [-1, 1]."""
+    noise = np.zeros((size, size), dtype=np.float32)
+    total = 0.0
+    for octave in range(octaves):
+        cells = max(1, size // scale) * 2 ** octave
+        amplitude = 0.5 ** octave
+        noise += _value_noise(rng, size, cells) * amplitude
+        total += amplitude
+    return noise / total
 
-    r, g, b = base_color
 
-    # Generate multi-octave noise
-    for y in range(size):
-        for x in range(size):
-            # Simple noise with multiple frequencies
-            noise = 0.0
-            for octave in range(3):
-                freq = 2 ** octave
-                amplitude = 1.0 / (octave + 1)
-                noise += (random.random() - 0.5) * amplitude
+def _gaussian_blur(field, sigma):
+    """Separable Gaussian blur of a 2D field with wrap-around edges."""
+    radius = int(np.ceil(3 * sigma))
+    offsets = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 * (offsets / sigma) ** 2).astype(np.float32)
+    kernel /= kernel.sum()
 
-            # Add some spatial coherence with sin waves
-            wave1 = math.sin(x * 0.05 + random.random() * 0.1) * 0.3
-            wave2 = math.sin(y * 0.07 + random.random() * 0.1) * 0.3
-            noise += (wave1 + wave2) * 0.5
+    for axis in (0, 1):
+        blurred = np.zeros_like(field)
+        for offset, weight in zip(offsets, kernel):
+            blurred += np.roll(field, offset, axis=axis) * weight
+        field = blurred
+    return field
 
-            variation = int(noise * noise_strength)
 
-            new_r = max(0, min(255, r + variation))
-            new_g = max(0, min(255, g + variation))
-            new_b = max(0, min(255, b + variation))
+def generate_noise_field(size=512, seed=None):
+    """Generate a tileable, blurred noise field in roughly [-1, 1]."""
+    rng = np.random.default_rng(seed)
 
-            pixels[x, y] = (new_r, new_g, new_b)
+    # Coherent multi-octave noise rather than per-pixel white noise
+    noise = _fbm_noise(rng, size)
 
     # Apply slight blur for smoother look
-    img = img.filter(ImageFilter.GaussianBlur(radius=1.5))
+    return _gaussian_blur(noise, sigma=1.5)
 
-    return img
 
+def colorize_noise(noise, base_color, noise_strength=25):
+    """Offset base_color by a noise field and pack the result as an RGB image."""
+    variation = (noise * noise_strength).astype(np.int16)
 
-def make_seamless(img):
-    """Make texture seamless by blending edges."""
-    size = img.size[0]
-    result = img.copy()
-    pixels = result.load()
-    src_pixels = img.load()
+    # Clip each channel straight into the packed uint8 buffer; no full-size RGB temporaries
+    arr = np.empty(noise.shape + (3,), dtype=np.uint8)
+    for channel, value in enumerate(base_color):
+        arr[..., channel] = np.clip(variation + value, 0, 255)
+    return Image.fromarray(arr, 'RGB')
 
-    blend_width = size // 4
 
-    for y in range(size):
-        for x in range(blend_width):
-            # Horizontal blend
-            t = x / blend_width
-            opposite_x = size - blend_width + x
+def generate_noise_texture(base_color, size=512, noise_strength=25, seed=None):
+    """Generate a texture with Perlin-like noise variation."""
+    return colorize_noise(generate_noise_field(size, seed), base_color, noise_strength)
+
+
+def _texture_filename(terrain):
+    return f"{terrain['id']:02d}_{terrain['name']}.png"
 
-            r1, g1, b1 = src_pixels[x, y]
-            r2, g2, b2 = src_pixels[opposite_x, y]
 
-            new_r = int(r1 * t + r2 * (1 - t))
-            new_g = int(g1 * t + g2 * (1 - t))
-            new_b = int(b1 * t + b2 * (1 - t))
+def _is_up_to_date(filepath, inputs_mtime):
+    """True if filepath exists and is newer than both this script and the config."""
+    return os.path.exists(filepath) and os.path.getmtime(filepath) >= inputs_mtime
 
-            pixels[x, y] = (new_r, new_g, new_b)
 
-    for x in range(size):
-        for y in range(blend_width):
-            # Vertical blend
-            t = y / blend_width
-            opposite_y = size - blend_width + y
+def _make_one(terrain, noise, output_dir):
+    """Color and save one terrain's texture; returns the written filename."""
+    color = tuple(terrain["color"])
+    filename = _texture_filename(terrain)
+    filepath = os.path.join(output_dir, filename)
 
-            r1, g1, b1 = pixels[x, y]
-            r2, g2, b2 = pixels[x, opposite_y]
+    img = colorize_noise(noise, color, noise_strength=20)
 
-            new_r = int(r1 * t + r2 * (1 - t))
-            new_g = int(g1 * t + g2 * (1 - t))
-            new_b = int(b1 * t + b2 * (1 - t))
+    # Placeholders are replaced before shipping, so favour encode speed over file size
+    img.save(filepath, "PNG", compress_level=1, optimize=False)
+    return filename
 
-            pixels[x, y] = (new_r, new_g, new_b)
 
-    return result
+def _pick_noise(noise_bank, terrain_id):
+    """Choose a bank field for a terrain, rotated so neighbouring ids don't repeat exactly."""
+    field = noise_bank[terrain_id % len(noise_bank)]
+    return np.rot90(field, k=(terrain_id // len(noise_bank)) % 4)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate placeholder terrain textures.")
+    parser.add_argument("--force", action="store_true",
+                        help="regenerate every texture, even ones newer than the script and config")
+    args = parser.parse_args()
+
     # Load terrain definitions from single source of truth
     config = load_terrain_config()
     terrains = config.get("terrains", [])
@@ -109,24 +143,31 @@ def main():
     output_dir = os.path.join(os.path.dirname(__file__), "textures", "base")
     os.makedirs(output_dir, exist_ok=True)
 
-    print(f"Generating {len(terrains)} placeholder terrain textures...")
+    # Incremental rebuild: skip outputs already newer than every input
+    if not args.force:
+        inputs_mtime = max(os.path.getmtime(__file__), os.path.getmtime(CONFIG_PATH))
+        stale = [t for t in terrains
+                 if not _is_up_to_date(os.path.join(output_dir, _texture_filename(t)), inputs_mtime)]
+        skipped = len(terrains) - len(stale)
+        if skipped:
+            print(f"Skipping {skipped} up-to-date textures (use --force to regenerate)")
+        terrains = stale
 
-    for terrain in terrains:
-        terrain_id = terrain["id"]
-        name = terrain["name"]
-        color = tuple(terrain["color"])
-        filename = f"{terrain_id:02d}_{name}.png"
-        filepath = os.path.join(output_dir, filename)
+    if not terrains:
+        print("Nothing to do.")
+        return
 
-        # Generate texture with noise
-        img = generate_noise_texture(color, size=512, noise_strength=20, seed=terrain_id * 42)
+    print(f"Generating {len(terrains)} placeholder terrain textures...")
 
-        # Make it seamless
-        img = make_seamless(img)
+    # Placeholders only need "base color plus variation", so a small bank of tileable
+    # noise fields is shared across all terrains and only the coloring is per terrain
+    noise_bank = [generate_noise_field(size=512, seed=i) for i in range(NOISE_BANK_SIZE)]
+    jobs = [(t, _pick_noise(noise_bank, t["id"]), output_dir) for t in terrains]
 
-        # Save
-        img.save(filepath, "PNG")
-        print(f"  Created: {filename}")
+    # Each terrain writes its own output file, so fan the coloring + encode out across cores
+    with multiprocessing.Pool(processes=os.cpu_count()) as pool:
+        for filename in pool.starmap(_make_one, jobs):
+            print(f"  Created: {filename}")
 
     print(f"\nDone! {len(terrains)} textures saved to {output_dir}")
     print("\nThese are placeholder textures. Replace with AI-generated textures for production.")